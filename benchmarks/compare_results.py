@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""Compare Rust (Criterion) and Go (go test -bench) PFCP benchmark results.
+
+Parses the text output of both benchmark suites, matches benchmarks by name,
+and writes a markdown comparison report covering throughput, per-category
+winners, and Go allocation statistics.
+
+Usage:
+    python3 compare_results.py --results-dir results --output COMPARISON.md
+
+Expected input files in the results directory:
+    rust_marshal.txt, rust_unmarshal.txt, rust_roundtrip.txt
+    go_marshal.txt, go_unmarshal.txt, go_roundtrip.txt
+"""
+
+import argparse
+import io
+import mmap
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from statistics import fmean
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the scalar path covers small runs.
+    np = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json is the fallback.
+    from json import loads as _json_loads
+
+# Criterion line: "heartbeat_marshal  time:   [1.21 µs 1.23 µs 1.26 µs]"
+_RUST_PATTERN = re.compile(
+    r"(\w+)\s+time:\s+\[[\d.]+\s+(?:ns|µs|ms|s)\s+([\d.]+)\s+(ns|µs|ms|s)\s+[\d.]+\s+(?:ns|µs|ms|s)\]"
+)
+# Go line: "BenchmarkMarshal/HeartbeatRequest-8   500000   2345 ns/op   128 B/op   4 allocs/op"
+_GO_PATTERN = re.compile(
+    r"Benchmark\w+/([^-\s]+)-\d+\s+(\d+)\s+(\d+)\s+ns/op(?:\s+(\d+)\s+B/op)?(?:\s+(\d+)\s+allocs/op)?"
+)
+
+# Bytes-mode twins of the patterns above, for matching directly over a
+# memory-mapped file without decoding it to str first.
+_RUST_PATTERN_B = re.compile(_RUST_PATTERN.pattern.encode("utf-8"))
+_GO_PATTERN_B = re.compile(_GO_PATTERN.pattern.encode("utf-8"))
+
+# Criterion time unit -> nanosecond multiplier.
+_NS_MULT = {"ns": 1, "µs": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
+
+# Unit -> index into the vectorized multiplier LUT (mirrors _NS_MULT).
+_UNIT_CODE = {"ns": 0, "µs": 1, "ms": 2, "s": 3}
+
+# NumPy call overhead only amortizes on reasonably large batches; below
+# this, the scalar conversion loop is faster.
+_NUMPY_MIN_BATCH = 512
+
+# Complexity keywords -> report category, matched in one scan. The group
+# index of the winning alternative selects the label from _CAT_MAP.
+_CAT_RE = re.compile(r"(simple)|(association)|(complex)", re.IGNORECASE)
+_CAT_MAP = ("Simple", "Medium", "Complex")
+
+# Field extractors for C-level map()/sum() reductions.
+_BYTES = attrgetter("bytes_per_op")
+_ALLOCS = attrgetter("allocs_per_op")
+
+# Constant fragments for the category tables; a fixed %-format string
+# skips the per-field conversion dispatch that f-strings pay per row.
+_RUST_FLAG = "🦀 Rust"
+_GO_FLAG = "🐹 Go"
+_ROW_FMT = "| %s | %s | %s | %s | %.1f%% |"
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """A single benchmark measurement, normalized to ns/op.
+
+    Declared with __slots__ so the thousands of instances produced for a
+    large Criterion run skip the per-instance __dict__ and get C-level
+    attribute access in the aggregation loops.
+    """
+
+    name: str
+    ns_per_op: float
+    operations_per_sec: float
+    category: str
+    bytes_per_op: Optional[int] = None
+    allocs_per_op: Optional[int] = None
+
+
+class ResultsParser:
+    """Parses raw benchmark runner output into BenchmarkResult records."""
+
+    def __init__(self, results_dir: Path):
+        self.results_dir = Path(results_dir)
+
+    def _iter_rust_raw(self, file_path: Path) -> Iterator[Tuple[str, float, str]]:
+        """Yield raw (name, value, unit) triples from Criterion output.
+
+        Walks the file through mmap with the bytes-mode pattern: no
+        duplicate decoded str of the whole file and no UTF-8 pass over
+        multi-MB Criterion dumps.
+        """
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Cheap C-level substring probe: warning-only or otherwise
+                # matchless files skip the regex engine entirely.
+                if mm.find(b"time:") < 0:
+                    return
+                for match in _RUST_PATTERN_B.finditer(mm):
+                    yield (
+                        match.group(1).decode("utf-8"),
+                        float(match.group(2)),
+                        match.group(3).decode("utf-8"),
+                    )
+
+    def _iter_rust_records(self, file_path: Path) -> Iterator[Tuple[str, float]]:
+        """Yield (name, ns_per_op) pairs without allocating result objects."""
+        _mult = _NS_MULT.get
+        for name, value, unit in self._iter_rust_raw(file_path):
+            yield name, value * _mult(unit, 1)
+
+    def parse_rust_ops(
+        self, file_path: Path
+    ) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Fast path: name->ops/sec and name->category dicts only.
+
+        For consumers that never touch the memory fields (throughput
+        comparisons, CI threshold checks) this skips the BenchmarkResult
+        allocation per line entirely.
+        """
+        ops: Dict[str, float] = {}
+        categories: Dict[str, str] = {}
+        categorize = self._categorize_benchmark
+        for name, ns_per_op in self._iter_rust_records(file_path):
+            ops[name] = 1e9 / ns_per_op
+            categories[name] = categorize(name)
+        return ops, categories
+
+    def parse_rust_results_json(self, file_path: Path) -> List[BenchmarkResult]:
+        """Parse aggregated Criterion JSON estimates.
+
+        Expects a single JSON object mapping benchmark names to the
+        contents of Criterion's machine-readable ``estimates.json``
+        (``{"bench": {"mean": {"point_estimate": ns}, ...}, ...}``).
+        Decoding JSON skips the regex engine and the per-sample float
+        parsing of the text path entirely, which is the biggest win on
+        large result sets.
+        """
+        results: List[BenchmarkResult] = []
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return results
+        categorize = self._categorize_benchmark
+        # Tolerate stale or truncated dumps the same way the text
+        # parsers tolerate garbage lines: warn and return no results
+        # instead of letting the traceback kill the whole run.
+        try:
+            data = _json_loads(file_path.read_bytes())
+            for name, estimates in data.items():
+                ns_per_op = float(estimates["mean"]["point_estimate"])
+                results.append(
+                    BenchmarkResult(
+                        name=name,
+                        ns_per_op=ns_per_op,
+                        operations_per_sec=1e9 / ns_per_op,
+                        category=categorize(name),
+                    )
+                )
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            print(
+                f"Warning: skipping malformed JSON results in {file_path}: {exc}",
+                file=sys.stderr,
+            )
+            return []
+        return results
+
+    def parse_rust_results(self, file_path: Path) -> List[BenchmarkResult]:
+        """Parse Criterion text output (`cargo bench` stdout)."""
+        results: List[BenchmarkResult] = []
+        names: List[str] = []
+        vals: List[float] = []
+        units: List[str] = []
+        for name, value, unit in self._iter_rust_raw(file_path):
+            names.append(name)
+            vals.append(value)
+            units.append(unit)
+
+        if np is not None and len(vals) > _NUMPY_MIN_BATCH:
+            # Batch the unit->ns conversion and ops/sec division; on large
+            # Criterion dumps the per-match Python arithmetic dominates.
+            arr = np.asarray(vals)
+            unit_codes = np.fromiter(
+                (_UNIT_CODE[u] for u in units), dtype=np.int8, count=len(units)
+            )
+            mults = np.array([1, 1_000, 1_000_000, 1_000_000_000])[unit_codes]
+            ns = arr * mults
+            ops = 1e9 / ns
+            categorize = self._categorize_benchmark
+            for name, ns_per_op, ops_per_sec in zip(names, ns, ops):
+                results.append(
+                    BenchmarkResult(
+                        name=name,
+                        ns_per_op=float(ns_per_op),
+                        operations_per_sec=float(ops_per_sec),
+                        category=categorize(name),
+                    )
+                )
+            return results
+
+        _mult = _NS_MULT.get
+        for name, value, unit in zip(names, vals, units):
+            ns_per_op = value * _mult(unit, 1)
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    ns_per_op=ns_per_op,
+                    operations_per_sec=1e9 / ns_per_op,
+                    category=self._categorize_benchmark(name),
+                )
+            )
+        return results
+
+    def _iter_go_records(
+        self, file_path: Path
+    ) -> Iterator[Tuple[str, float, Optional[int], Optional[int]]]:
+        """Yield (name, ns_per_op, bytes_per_op, allocs_per_op) tuples."""
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"Benchmark") < 0:
+                    return
+                for match in _GO_PATTERN_B.finditer(mm):
+                    yield (
+                        match.group(1).decode("utf-8"),
+                        float(match.group(3)),
+                        int(match.group(4)) if match.group(4) else None,
+                        int(match.group(5)) if match.group(5) else None,
+                    )
+
+    def parse_go_ops(self, file_path: Path) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """Fast path: name->ops/sec and name->category dicts only."""
+        ops: Dict[str, float] = {}
+        categories: Dict[str, str] = {}
+        categorize = self._categorize_benchmark
+        for name, ns_per_op, _, _ in self._iter_go_records(file_path):
+            ops[name] = 1e9 / ns_per_op
+            categories[name] = categorize(name)
+        return ops, categories
+
+    def parse_go_results(self, file_path: Path) -> List[BenchmarkResult]:
+        """Parse `go test -bench . -benchmem` output."""
+        results: List[BenchmarkResult] = []
+        categorize = self._categorize_benchmark
+        for name, ns_per_op, bytes_per_op, allocs_per_op in self._iter_go_records(
+            file_path
+        ):
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    ns_per_op=ns_per_op,
+                    operations_per_sec=1e9 / ns_per_op,
+                    category=categorize(name),
+                    bytes_per_op=bytes_per_op,
+                    allocs_per_op=allocs_per_op,
+                )
+            )
+        return results
+
+    def _categorize_benchmark(self, name: str) -> str:
+        """Bucket a benchmark by message complexity based on its name."""
+        m = _CAT_RE.search(name)
+        return _CAT_MAP[m.lastindex - 1] if m else "Other"
+
+
+class ResultsComparator:
+    """Joins Rust and Go results by name and renders the comparison report."""
+
+    def __init__(
+        self, rust_results: List[BenchmarkResult], go_results: List[BenchmarkResult]
+    ):
+        self.rust_results: Dict[str, BenchmarkResult] = {
+            r.name: r for r in rust_results
+        }
+        self.go_results: Dict[str, BenchmarkResult] = {r.name: r for r in go_results}
+        # dict views are already set-like; intersecting them directly
+        # avoids copying both key tables into intermediate sets.
+        self.common_benchmarks = self.rust_results.keys() & self.go_results.keys()
+        # Resolve both dict lookups once; every aggregator below iterates
+        # these tuples instead of re-indexing rust_results/go_results.
+        self.common_pairs: List[Tuple[str, BenchmarkResult, BenchmarkResult]] = [
+            (name, self.rust_results[name], self.go_results[name])
+            for name in self.common_benchmarks
+        ]
+        # Sort once by name; the category buckets below inherit this
+        # order, so the section generators need no per-call sorted().
+        self.common_pairs.sort(key=lambda pair: pair[0])
+        # Bucket once here instead of rescanning the full pair list for
+        # each category section of the report.
+        self.by_category: Dict[
+            str, List[Tuple[str, BenchmarkResult, BenchmarkResult]]
+        ] = {
+            "Simple": [],
+            "Medium": [],
+            "Complex": [],
+            "Other": [],
+        }
+        for pair in self.common_pairs:
+            self.by_category[pair[1].category].append(pair)
+        self._stats: Optional[Dict[str, float]] = None
+
+    def _compute_stats(self) -> Dict[str, float]:
+        """Aggregate throughput sums and win counts in a single pass.
+
+        The summary and winners sections read the same two fields over the
+        same benchmark set; fusing their loops does the dict lookups once
+        and caches the result for the lifetime of the comparator.
+        """
+        if self._stats is None:
+            rust_sum = go_sum = 0.0
+            rust_wins = 0
+            for _, rust, go in self.common_pairs:
+                r = rust.operations_per_sec
+                g = go.operations_per_sec
+                rust_sum += r
+                go_sum += g
+                # Ties count for Rust, matching _format_row's >= labeling.
+                rust_wins += r >= g
+            self._stats = {
+                "rust_sum": rust_sum,
+                "go_sum": go_sum,
+                "rust_wins": rust_wins,
+                "go_wins": len(self.common_benchmarks) - rust_wins,
+            }
+        return self._stats
+
+    def generate_comparison_report(self) -> str:
+        sections = [
+            ["# Rust vs Go PFCP Benchmark Comparison", ""],
+            self._generate_summary(),
+            *(
+                self._generate_category_comparison(category)
+                for category in ("Simple", "Medium", "Complex")
+            ),
+            self._generate_winners_analysis(),
+            self._generate_memory_analysis(),
+        ]
+        # Assemble in a single growable buffer rather than joining one
+        # flat list of every line in the report.
+        buf = io.StringIO()
+        first = True
+        for section in sections:
+            if not section:
+                continue
+            if not first:
+                buf.write("\n")
+            buf.write("\n".join(section))
+            first = False
+        return buf.getvalue()
+
+    def _generate_summary(self) -> List[str]:
+        lines = ["## Summary", ""]
+        if not self.common_benchmarks:
+            lines.append("No common benchmarks found between Rust and Go results.")
+            lines.append("")
+            return lines
+        count = len(self.common_benchmarks)
+        stats = self._compute_stats()
+        rust_avg = stats["rust_sum"] / count
+        go_avg = stats["go_sum"] / count
+        lines.append(f"- Common benchmarks: **{count}**")
+        lines.append(f"- Rust average throughput: **{rust_avg:,.0f} ops/s**")
+        lines.append(f"- Go average throughput: **{go_avg:,.0f} ops/s**")
+        if go_avg > 0:
+            lines.append(f"- Overall ratio (Rust/Go): **{rust_avg / go_avg:.2f}x**")
+        lines.append("")
+        return lines
+
+    def _generate_category_comparison(self, category: str) -> List[str]:
+        bucket = self.by_category[category]
+        if not bucket:
+            return []
+        lines = [
+            f"## {category} Messages",
+            "",
+            "| Benchmark | 🦀 Rust (ops/s) | 🐹 Go (ops/s) | Faster | Improvement |",
+            "|-----------|----------------|--------------|--------|-------------|",
+        ]
+        lines.extend(self._format_row(name, r, g) for name, r, g in bucket)
+        lines.append("")
+        return lines
+
+    @staticmethod
+    def _format_row(name: str, r: BenchmarkResult, g: BenchmarkResult) -> str:
+        if r.operations_per_sec >= g.operations_per_sec:
+            faster = _RUST_FLAG
+            improvement = (r.operations_per_sec / g.operations_per_sec - 1) * 100
+        else:
+            faster = _GO_FLAG
+            improvement = (g.operations_per_sec / r.operations_per_sec - 1) * 100
+        ops_r = format(r.operations_per_sec, ",.0f")
+        ops_g = format(g.operations_per_sec, ",.0f")
+        return _ROW_FMT % (name, ops_r, ops_g, faster, improvement)
+
+    def _generate_winners_analysis(self) -> List[str]:
+        lines = ["## Winners", ""]
+        if not self.common_benchmarks:
+            lines.append("No common benchmarks to analyze.")
+            lines.append("")
+            return lines
+        stats = self._compute_stats()
+        lines.append(f"- 🦀 Rust faster in **{stats['rust_wins']}** benchmarks")
+        lines.append(f"- 🐹 Go faster in **{stats['go_wins']}** benchmarks")
+        lines.append("")
+        return lines
+
+    def _generate_memory_analysis(self) -> List[str]:
+        lines = ["## Go Memory Profile", ""]
+        go_with_memory = [
+            go for _, _, go in self.common_pairs if go.bytes_per_op is not None
+        ]
+        if not go_with_memory:
+            lines.append("No Go memory statistics available (run with `-benchmem`).")
+            lines.append("")
+            return lines
+        avg_bytes = fmean(map(_BYTES, go_with_memory))
+        # Average over the benchmarks that actually report allocations,
+        # filtering on identity so a legitimate 0 allocs/op still counts
+        # in both numerator and denominator.
+        allocs = [a for a in map(_ALLOCS, go_with_memory) if a is not None]
+        avg_allocs = fmean(allocs) if allocs else 0.0
+        lines.append(f"- Average bytes/op: **{avg_bytes:,.0f} B**")
+        lines.append(f"- Average allocs/op: **{avg_allocs:.1f}**")
+        lines.append(
+            "- Rust allocations are not reported by Criterion; "
+            "see `cargo bench` with a custom allocator for equivalents."
+        )
+        lines.append("")
+        return lines
+
+
+def _run_throughput_only(parser: ResultsParser, args: argparse.Namespace) -> int:
+    """Compare ops/sec only, using the allocation-free parser fast paths.
+
+    Skips the category tables and memory analysis entirely; no
+    BenchmarkResult instances are built.
+    """
+    rust_stems = ("rust_marshal", "rust_unmarshal", "rust_roundtrip")
+    go_stems = ("go_marshal", "go_unmarshal", "go_roundtrip")
+    jobs = [
+        (parser.parse_rust_ops, args.results_dir / f"{stem}.txt")
+        for stem in rust_stems
+    ] + [(parser.parse_go_ops, args.results_dir / f"{stem}.txt") for stem in go_stems]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(fn, path) for fn, path in jobs]
+        results = [future.result() for future in futures]
+
+    rust_ops: Dict[str, float] = {}
+    go_ops: Dict[str, float] = {}
+    for ops, _ in results[: len(rust_stems)]:
+        rust_ops.update(ops)
+    for ops, _ in results[len(rust_stems) :]:
+        go_ops.update(ops)
+
+    print(f"Parsed {len(rust_ops)} Rust and {len(go_ops)} Go results")
+
+    lines = ["# Rust vs Go PFCP Throughput Comparison", ""]
+    common = rust_ops.keys() & go_ops.keys()
+    if not common:
+        lines.append("No common benchmarks found between Rust and Go results.")
+    else:
+        rust_avg = fmean(rust_ops[name] for name in common)
+        go_avg = fmean(go_ops[name] for name in common)
+        rust_wins = sum(rust_ops[name] >= go_ops[name] for name in common)
+        lines.append(f"- Common benchmarks: **{len(common)}**")
+        lines.append(f"- Rust average throughput: **{rust_avg:,.0f} ops/s**")
+        lines.append(f"- Go average throughput: **{go_avg:,.0f} ops/s**")
+        if go_avg > 0:
+            lines.append(f"- Overall ratio (Rust/Go): **{rust_avg / go_avg:.2f}x**")
+        lines.append(f"- {_RUST_FLAG} faster in **{rust_wins}** benchmarks")
+        lines.append(f"- {_GO_FLAG} faster in **{len(common) - rust_wins}** benchmarks")
+    lines.append("")
+    args.output.write_bytes("\n".join(lines).encode("utf-8"))
+    print(f"Report written to {args.output} (throughput only)")
+    return 0
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(
+        description="Compare Rust and Go PFCP benchmark results"
+    )
+    arg_parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path("results"),
+        help="Directory containing benchmark output files",
+    )
+    arg_parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("COMPARISON.md"),
+        help="Path for the generated markdown report",
+    )
+    arg_parser.add_argument(
+        "--throughput-only",
+        action="store_true",
+        help="Compare ops/sec only via the lightweight parser path "
+        "(no category tables or memory analysis)",
+    )
+    args = arg_parser.parse_args()
+
+    parser = ResultsParser(args.results_dir)
+    if args.throughput_only:
+        return _run_throughput_only(parser, args)
+
+    # The six parses are independent and I/O-bound (file reads release
+    # the GIL), so run them concurrently and collect in input order.
+    def rust_job(stem: str):
+        # Prefer Criterion's machine-readable JSON dump when present;
+        # it parses far faster than the text log.
+        json_path = args.results_dir / f"{stem}.json"
+        if json_path.exists():
+            return parser.parse_rust_results_json, json_path
+        return parser.parse_rust_results, args.results_dir / f"{stem}.txt"
+
+    jobs = [
+        rust_job("rust_marshal"),
+        rust_job("rust_unmarshal"),
+        rust_job("rust_roundtrip"),
+        (parser.parse_go_results, args.results_dir / "go_marshal.txt"),
+        (parser.parse_go_results, args.results_dir / "go_unmarshal.txt"),
+        (parser.parse_go_results, args.results_dir / "go_roundtrip.txt"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(fn, path) for fn, path in jobs]
+        results = [future.result() for future in futures]
+
+    all_rust_results = results[0] + results[1] + results[2]
+    all_go_results = results[3] + results[4] + results[5]
+
+    print(f"Parsed {len(all_rust_results)} Rust and {len(all_go_results)} Go results")
+
+    if not all_rust_results or not all_go_results:
+        # One implementation didn't run (common during incremental
+        # development); skip the comparator and the report passes
+        # entirely and emit a short single-sided summary instead.
+        lines = ["# Rust vs Go PFCP Benchmark Comparison", ""]
+        if not all_rust_results and not all_go_results:
+            lines.append("No benchmark results were found.")
+        else:
+            side, have = (
+                ("Rust", all_rust_results)
+                if all_rust_results
+                else ("Go", all_go_results)
+            )
+            lines.append(
+                f"Only {side} results were found (**{len(have)}** benchmarks); "
+                "nothing to compare."
+            )
+        lines.append("")
+        args.output.write_bytes("\n".join(lines).encode("utf-8"))
+        print(f"Report written to {args.output} (single-sided)")
+        return 0
+
+    comparator = ResultsComparator(all_rust_results, all_go_results)
+    report = comparator.generate_comparison_report()
+
+    report_file = args.output
+    # Encode once and write raw bytes: skips the TextIOWrapper stack and
+    # its incremental encoding / newline translation.
+    report_file.write_bytes(report.encode("utf-8"))
+    print(f"Report written to {report_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())